@@ -254,6 +254,9 @@ class MotorsportCalendarGenerator:
             if self.data_collector:
                 self.data_collector.cleanup()
             
+            if self.event_processor:
+                self.event_processor.cleanup()
+            
             if self.ical_generator:
                 self.ical_generator.cleanup()
                 
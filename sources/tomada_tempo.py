@@ -12,10 +12,27 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from .base_source import BaseSource
 
+# Date patterns used by TomadaTempoSource._extract_date, compiled once at import
+# Weekday + date (e.g., "SÁBADO – 02/08/2025")
+_WEEKDAY_DATE_RE = re.compile(
+    r'(?:segunda|terça|quarta|quinta|sexta|sábado|domingo|monday|tuesday|wednesday|thursday|friday|saturday|sunday)'
+    r'\s*[–\-]?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
+    re.IGNORECASE,
+)
+_DATE_PARTS_RE = re.compile(r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})')
+# DD/MM/YYYY, YYYY/MM/DD and DD/MM/YY (with digit boundaries to avoid partial captures)
+_DD_MM_YYYY_RE = re.compile(r'(?<!\d)(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})(?!\d)')
+_YYYY_MM_DD_RE = re.compile(r'(?<!\d)(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})(?!\d)')
+_DD_MM_YY_RE = re.compile(r'(?<!\d)(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2})(?!\d)')
+
 
 class TomadaTempoSource(BaseSource):
     """Primary data source for tomadadetempo.com.br"""
     
+    # BeautifulSoup tree builder: lxml (C, libxml2) is a hard requirement and much faster
+    # than the pure-Python 'html.parser'; override per instance/class if needed
+    BS4_PARSER = 'lxml'
+    
     def get_display_name(self) -> str:
         """Get human-readable display name."""
         return "Tomada de Tempo"
@@ -155,7 +172,7 @@ class TomadaTempoSource(BaseSource):
                     self.logger.debug("⚠️ Failed to load main page for weekend programming link search")
                 return events
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, self.BS4_PARSER)
             
             # Format target date for link matching
             weekend_date_formats = [
@@ -287,7 +304,7 @@ class TomadaTempoSource(BaseSource):
         try:
             if getattr(self, 'cancel_event', None) is not None and self.cancel_event.is_set():
                 raise TimeoutError("Cancelled")
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, self.BS4_PARSER)
             
             # Extract programming context (weekend dates) from page title or URL
             programming_context = self._extract_programming_context(soup, page_url)
@@ -791,12 +808,11 @@ class TomadaTempoSource(BaseSource):
     def _extract_date(self, text: str) -> Optional[str]:
         """Extract date from text with improved parsing."""
         # Look for weekday + date patterns (e.g., "SÁBADO – 02/08/2025")
-        weekday_date_pattern = r'(?:segunda|terça|quarta|quinta|sexta|sábado|domingo|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s*[–\-]?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})'
-        match = re.search(weekday_date_pattern, text, re.IGNORECASE)
+        match = _WEEKDAY_DATE_RE.search(text)
         if match:
             date_part = match.group(1)
             # Process the date part
-            date_match = re.search(r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})', date_part)
+            date_match = _DATE_PARTS_RE.search(date_part)
             if date_match:
                 day, month, year = date_match.groups()
                 try:
@@ -810,8 +826,7 @@ class TomadaTempoSource(BaseSource):
         
         # Prefer full-year formats with boundaries to avoid partial captures
         # 1) DD/MM/YYYY or DD-MM-YYYY (with word boundaries)
-        dd_mm_yyyy_pattern = r'(?<!\d)(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})(?!\d)'
-        match = re.search(dd_mm_yyyy_pattern, text)
+        match = _DD_MM_YYYY_RE.search(text)
         if match:
             day, month, year = match.groups()
             try:
@@ -822,8 +837,7 @@ class TomadaTempoSource(BaseSource):
                 pass
 
         # 2) YYYY/MM/DD or YYYY-MM-DD (ISO) BEFORE 2-digit-year patterns
-        yyyy_mm_dd_pattern = r'(?<!\d)(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})(?!\d)'
-        match = re.search(yyyy_mm_dd_pattern, text)
+        match = _YYYY_MM_DD_RE.search(text)
         if match:
             year, month, day = match.groups()
             try:
@@ -834,8 +848,7 @@ class TomadaTempoSource(BaseSource):
                 pass
 
         # 3) DD/MM/YY or DD-MM-YY (with boundaries) as last resort
-        dd_mm_yy_pattern = r'(?<!\d)(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2})(?!\d)'
-        match = re.search(dd_mm_yy_pattern, text)
+        match = _DD_MM_YY_RE.search(text)
         if match:
             day, month, year = match.groups()
             try:
@@ -1037,7 +1050,7 @@ class TomadaTempoSource(BaseSource):
             List of events extracted from text
         """
         events = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, self.BS4_PARSER)
         
         # Get all text content
         text_content = soup.get_text(separator='\n', strip=True)
@@ -1,10 +1,13 @@
 import json
 import sqlite3
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, List
+
+import numpy as np
 
 
 @dataclass
@@ -12,43 +15,122 @@ class CacheConfig:
     dir: Path
     ttl_days: int = 30
     lru_capacity: int = 10000
+    precision: str = "fp32"  # 'fp32' (JSON) | 'fp16' (BLOB float16 no disco)
 
 
 class LRUCache:
     def __init__(self, capacity: int):
         self.capacity = max(1, int(capacity))
-        self.data: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self.data: "OrderedDict[str, List[float]]" = OrderedDict()
 
     def get(self, key: str) -> Optional[List[float]]:
-        item = self.data.get(key)
-        if item is None:
+        # move to end (most recently used); um miss custa só o KeyError
+        try:
+            self.data.move_to_end(key)
+        except KeyError:
             return None
-        _, value = item
-        # move to end (most recently used)
-        self.data.move_to_end(key)
-        return value
+        return self.data[key]
 
     def put(self, key: str, value: List[float]):
-        now = time.time()
-        if key in self.data:
-            self.data.move_to_end(key)
-        self.data[key] = (now, value)
+        self.data[key] = value
+        self.data.move_to_end(key)
         if len(self.data) > self.capacity:
             self.data.popitem(last=False)
 
 
+class _SieveNode:
+    __slots__ = ("key", "value", "visited", "newer", "older")
+
+    def __init__(self, key: str, value: List[float]):
+        self.key = key
+        self.value = value
+        self.visited = False
+        self.newer: Optional["_SieveNode"] = None
+        self.older: Optional["_SieveNode"] = None
+
+
+class SieveCache:
+    """Cache em memória com despejo SIEVE (mesma interface do LRUCache).
+
+    Um hit só marca o item como visitado (sem reordenar). No despejo, o
+    ponteiro ``hand`` anda do mais antigo para o mais novo limpando marcas e
+    remove o primeiro item não visitado; itens novos entram na cabeça.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self.data: Dict[str, _SieveNode] = {}
+        self._head: Optional[_SieveNode] = None  # mais novo
+        self._tail: Optional[_SieveNode] = None  # mais antigo
+        self._hand: Optional[_SieveNode] = None
+
+    def get(self, key: str) -> Optional[List[float]]:
+        node = self.data.get(key)
+        if node is None:
+            return None
+        node.visited = True
+        return node.value
+
+    def put(self, key: str, value: List[float]):
+        node = self.data.get(key)
+        if node is not None:
+            node.value = value
+            node.visited = True
+            return
+        if len(self.data) >= self.capacity:
+            self._evict()
+        node = _SieveNode(key, value)
+        node.older = self._head
+        if self._head is not None:
+            self._head.newer = node
+        self._head = node
+        if self._tail is None:
+            self._tail = node
+        self.data[key] = node
+
+    def _evict(self):
+        node = self._hand or self._tail
+        while node.visited:
+            node.visited = False
+            node = node.newer or self._tail
+        self._hand = node.newer
+        # desencadeia o nó
+        if node.newer is not None:
+            node.newer.older = node.older
+        else:
+            self._head = node.older
+        if node.older is not None:
+            node.older.newer = node.newer
+        else:
+            self._tail = node.newer
+        del self.data[node.key]
+
+
 class DiskCache:
-    def __init__(self, db_path: Path, ttl_days: int):
+    def __init__(self, db_path: Path, ttl_days: int, precision: str = "fp32"):
         self.db_path = db_path
         self.ttl_seconds = int(ttl_days) * 86400 if ttl_days >= 0 else -1
+        # fp16: vetores gravados como BLOB float16 (metade dos bytes), lidos de volta como float32
+        self.fp16 = str(precision).lower() == "fp16"
+        # Uma conexão por instância: abrir o SQLite a cada get/put dominava o custo do cache
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
         self._init_db()
 
-    def _connect(self):
-        return sqlite3.connect(str(self.db_path))
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def _init_db(self):
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS embeddings (
@@ -62,12 +144,12 @@ class DiskCache:
             conn.commit()
 
     def get(self, key: str) -> Optional[List[float]]:
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             cur = conn.execute("SELECT v, ts FROM embeddings WHERE k=?", (key,))
             row = cur.fetchone()
             if not row:
                 return None
-            v_json, ts = row
+            v_raw, ts = row
             if self.ttl_seconds >= 0:
                 if time.time() - ts > self.ttl_seconds:
                     # expired: delete and miss
@@ -75,7 +157,10 @@ class DiskCache:
                     conn.commit()
                     return None
             try:
-                return json.loads(v_json)
+                # Leitura aceita os dois formatos (entradas antigas em JSON continuam válidas)
+                if isinstance(v_raw, bytes):
+                    return np.frombuffer(v_raw, dtype=np.float16).astype(np.float32).tolist()
+                return json.loads(v_raw)
             except Exception:
                 # corrupt entry
                 conn.execute("DELETE FROM embeddings WHERE k=?", (key,))
@@ -84,17 +169,20 @@ class DiskCache:
 
     def put(self, key: str, value: List[float]):
         ts = int(time.time())
-        v_json = json.dumps(value, separators=(",", ":"))
-        with self._connect() as conn:
+        if self.fp16:
+            v_raw = np.asarray(value, dtype=np.float16).tobytes()
+        else:
+            v_raw = json.dumps(value, separators=(",", ":"))
+        with self._lock, self._connect() as conn:
             conn.execute(
                 "INSERT OR REPLACE INTO embeddings(k, v, ts) VALUES(?,?,?)",
-                (key, v_json, ts),
+                (key, v_raw, ts),
             )
             conn.commit()
 
 
 class CombinedCache:
-    def __init__(self, memory: LRUCache, disk: DiskCache):
+    def __init__(self, memory: "LRUCache | SieveCache", disk: DiskCache):
         self.memory = memory
         self.disk = disk
         self.hits = 0
@@ -122,6 +210,7 @@ class CombinedCache:
 __all__ = [
     "CacheConfig",
     "LRUCache",
+    "SieveCache",
     "DiskCache",
     "CombinedCache",
 ]
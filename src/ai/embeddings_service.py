@@ -1,20 +1,48 @@
+import functools
 import hashlib
 import logging
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from sklearn.feature_extraction.text import HashingVectorizer
 from sklearn.preprocessing import normalize
 
-from .cache import LRUCache, DiskCache, CombinedCache, CacheConfig
+from .cache import LRUCache, SieveCache, DiskCache, CombinedCache, CacheConfig
 
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _shared_onnx_session(
+    model_path: str,
+    providers: Tuple[str, ...],
+    intra_op_num_threads: Optional[int],
+    inter_op_num_threads: Optional[int],
+    model_mtime_ns: int,
+):
+    """Cria (uma vez por modelo/providers/threads) a InferenceSession do ORT.
+
+    Parse e otimização do grafo são caros; instâncias do serviço com a mesma
+    configuração reutilizam a sessão (``run`` é thread-safe). O mtime do modelo
+    entra na chave para que um arquivo substituído gere nova sessão. Exceções
+    não são cacheadas, então falhas de provider são tentadas de novo.
+    """
+    import onnxruntime as ort  # type: ignore
+
+    sess_opts = ort.SessionOptions()
+    # Lotes de textos curtos: sem threads configuradas, roda em 1 thread sequencial
+    # (o pool padrão de num_cpus threads só fica em spin-wait entre chamadas)
+    sess_opts.intra_op_num_threads = intra_op_num_threads or 1
+    sess_opts.inter_op_num_threads = inter_op_num_threads or 1
+    sess_opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(model_path, sess_opts, providers=list(providers))
+
+
 @dataclass
 class EmbeddingsConfig:
     # Core
@@ -26,10 +54,12 @@ class EmbeddingsConfig:
     backend: str = "hashing"  # 'hashing' (fase 1, 100% offline)
     dim: int = 256
     lru_capacity: int = 10000
+    cache_eviction: str = "lru"  # 'lru'|'sieve' (política do cache em memória)
 
     # Cache (diretório e TTL vêm da seção ai.cache)
     cache_dir: Path = Path("cache/embeddings")
     ttl_days: int = 30
+    cache_precision: str = "fp32"  # 'fp32'|'fp16' (formato dos vetores no cache em disco)
 
     # ONNX (opcional)
     onnx_enabled: bool = False
@@ -37,6 +67,7 @@ class EmbeddingsConfig:
     onnx_model_path: Optional[Path] = None
     onnx_intra_op_num_threads: Optional[int] = None
     onnx_inter_op_num_threads: Optional[int] = None
+    onnx_quantized: bool = False  # prefere a variante INT8 (<modelo>.qdyn.onnx) gerada por scripts/eval/export_onnx.py
 
 
 class EmbeddingsService:
@@ -49,8 +80,9 @@ class EmbeddingsService:
 
         # Cache (memória + disco)
         db_path = Path(self.cfg.cache_dir) / "embeddings_cache.sqlite"
-        memory = LRUCache(self.cfg.lru_capacity)
-        disk = DiskCache(db_path=db_path, ttl_days=self.cfg.ttl_days)
+        memory_cls = SieveCache if str(self.cfg.cache_eviction).lower() == "sieve" else LRUCache
+        memory = memory_cls(self.cfg.lru_capacity)
+        disk = DiskCache(db_path=db_path, ttl_days=self.cfg.ttl_days, precision=self.cfg.cache_precision)
         self.cache = CombinedCache(memory=memory, disk=disk)
 
         # Métricas simples
@@ -69,6 +101,9 @@ class EmbeddingsService:
         self._onnx_session = None  # compat: usado nos testes
         self._init_onnx_backend_if_possible()
 
+        # Prefixo das chaves de cache (backend e dim já definidos)
+        self._key_prefix = f"{self.backend}:{self.cfg.dim}:".encode("utf-8")
+
         logger.info(
             "EmbeddingsService iniciado (backend=%s, dim=%d, batch_size=%d, cache_dir=%s)",
             self.backend,
@@ -97,11 +132,17 @@ class EmbeddingsService:
             if not model_path:
                 return
             model_path = Path(model_path)
+            if getattr(self.cfg, "onnx_quantized", False):
+                quant_path = model_path.with_name(model_path.stem + ".qdyn.onnx")
+                if quant_path.exists():
+                    model_path = quant_path
+                else:
+                    logger.warning("onnx_quantized ativo, mas %s não existe. Usando %s.", str(quant_path), str(model_path))
             if not model_path.exists():
                 logger.warning("ONNX habilitado, mas modelo não encontrado em %s. Mantendo 'hashing'.", str(model_path))
                 return
             try:
-                import onnxruntime as ort  # type: ignore
+                import onnxruntime  # type: ignore  # noqa: F401 (checagem de disponibilidade)
             except Exception as e:
                 logger.warning("onnxruntime indisponível (%s). Mantendo 'hashing'.", e)
                 return
@@ -118,14 +159,17 @@ class EmbeddingsService:
             for p in raw_providers:
                 ps = str(p).strip()
                 providers.append(norm_map.get(ps.lower(), ps))
-            sess_opts = ort.SessionOptions()
-            if getattr(self.cfg, "onnx_intra_op_num_threads", None):
-                sess_opts.intra_op_num_threads = int(self.cfg.onnx_intra_op_num_threads)
-            if getattr(self.cfg, "onnx_inter_op_num_threads", None):
-                sess_opts.inter_op_num_threads = int(self.cfg.onnx_inter_op_num_threads)
+            intra = getattr(self.cfg, "onnx_intra_op_num_threads", None)
+            inter = getattr(self.cfg, "onnx_inter_op_num_threads", None)
 
             try:
-                self.ort_session = ort.InferenceSession(str(model_path), sess_opts, providers=providers)
+                self.ort_session = _shared_onnx_session(
+                    str(model_path),
+                    tuple(providers),
+                    int(intra) if intra else None,
+                    int(inter) if inter else None,
+                    model_path.stat().st_mtime_ns,
+                )
                 self._onnx_session = self.ort_session  # compat de atributo
                 self.backend = "onnx"
                 logger.info("ONNX Runtime inicializado (providers=%s, model=%s)", providers, str(model_path))
@@ -137,10 +181,17 @@ class EmbeddingsService:
             # Nunca bloquear inicialização por causa do ONNX
             logger.exception("Erro inesperado ao inicializar backend ONNX. Mantendo 'hashing'.")
 
+    @staticmethod
+    def cosine_batch(A, B) -> np.ndarray:
+        """Matriz de similaridade do cosseno (len(A) x len(B)) em uma única
+        multiplicação de matrizes. Vetores de norma zero resultam em 0."""
+        A = normalize(np.atleast_2d(np.asarray(A, dtype=np.float32)), norm="l2", axis=1)
+        B = normalize(np.atleast_2d(np.asarray(B, dtype=np.float32)), norm="l2", axis=1)
+        return A @ B.T
+
     def _key_for(self, text: str) -> str:
-        # A chave inclui backend e dim para evitar colisão de versões/configs
-        base = f"{self.backend}:{self.cfg.dim}:".encode("utf-8")
-        return hashlib.sha256(base + text.encode("utf-8")).hexdigest()
+        # A chave inclui backend e dim (chave do BLAKE2b) para evitar colisão de versões/configs
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16, key=self._key_prefix).hexdigest()
 
     def _embed_batch(self, texts: List[str]) -> List[List[float]]:
         if not texts:
@@ -151,11 +202,15 @@ class EmbeddingsService:
                 return self._embed_batch_onnx(texts)
             except Exception as e:
                 logger.warning("Falha no caminho ONNX (%s). Caindo para hashing.", e)
-        # Hashing backend
+        return self._embed_batch_hashing(texts)
+
+    def _embed_batch_hashing(self, texts: List[str]) -> List[List[float]]:
+        """Hashing backend: o lote inteiro passa por uma única transformação
+        esparsa + normalização L2, e a matriz densa vira listas em uma só
+        chamada (sem laço Python por linha)."""
         X = self.vectorizer.transform(texts)  # sparse matrix
         X = normalize(X, norm="l2", axis=1, copy=False)
-        dense = X.toarray().astype(np.float32)  # retorno denso
-        return [dense[i, :].tolist() for i in range(dense.shape[0])]
+        return X.astype(np.float32).toarray().tolist()
 
     def _embed_batch_onnx(self, texts: List[str]) -> List[List[float]]:
         """Stub de inferência ONNX. Sem modelo/tokenizador oficial no repo,
@@ -166,10 +221,7 @@ class EmbeddingsService:
         """
         if self._onnx_session is None:
             # fallback para hashing
-            X = self.vectorizer.transform(texts)
-            X = normalize(X, norm="l2", axis=1, copy=False)
-            dense = X.toarray().astype(np.float32)
-            return [dense[i, :].tolist() for i in range(dense.shape[0])]
+            return self._embed_batch_hashing(texts)
 
         # Faz UMA única chamada de inferência para o primeiro item do batch
         first_text = texts[0]
@@ -195,15 +247,13 @@ class EmbeddingsService:
         outputs: List[List[float]] = [first_vec.tolist()]
         if len(texts) > 1:
             # Para os demais itens do batch, gera embeddings determinísticos via hashing
-            X = self.vectorizer.transform(texts[1:])
-            X = normalize(X, norm="l2", axis=1, copy=False)
-            dense = X.toarray().astype(np.float32)
-            outputs.extend([dense[i, :].tolist() for i in range(dense.shape[0])])
+            outputs.extend(self._embed_batch_hashing(texts[1:]))
         return outputs
 
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """Gera embeddings para uma lista de textos.
         - Usa cache (memória+disco) por item
+        - Textos repetidos na mesma chamada são calculados uma única vez
         - Faz batching para os misses
         - Retorna na mesma ordem dos textos de entrada
         """
@@ -214,20 +264,30 @@ class EmbeddingsService:
 
         # Primeiro tenta recuperar do cache
         results: List[Optional[List[float]]] = [None] * len(texts)
-        to_compute: List[Tuple[int, str]] = []
+        to_compute: List[Tuple[int, str, str]] = []
+        pending: Dict[str, List[int]] = {}  # chave -> índices que aguardam o mesmo miss
         for i, t in enumerate(texts):
             t = "" if t is None else str(t)
             k = self._key_for(t)
+            dup = pending.get(k)
+            if dup is not None:
+                # Repetição de um miss já enfileirado: reaproveita o cálculo
+                dup.append(i)
+                continue
             v = self.cache.get(k)
             if v is not None:
                 # Restaura do cache: ONNX retorna np.ndarray; hashing retorna list
                 try:
-                    arr = np.asarray(v, dtype=np.float32)
-                    results[i] = arr if self.backend == "onnx" else arr.tolist()
+                    if self.backend == "onnx":
+                        results[i] = np.asarray(v, dtype=np.float32)
+                    else:
+                        # Lista já em float32: cópia rasa, sem ida e volta por ndarray
+                        results[i] = list(v)
                 except Exception:
                     results[i] = None
             else:
-                to_compute.append((i, t))
+                pending[k] = [i]
+                to_compute.append((i, t, k))
 
         # Métricas de cache
         self.metrics["cache_hits"] += self.cache.hits
@@ -239,20 +299,28 @@ class EmbeddingsService:
         # Processa em lotes os itens faltantes
         for start in range(0, len(to_compute), self.cfg.batch_size):
             chunk = to_compute[start : start + self.cfg.batch_size]
-            batch_indices = [idx for idx, _ in chunk]
-            batch_texts = [t for _, t in chunk]
+            batch_texts = [t for _, t, _ in chunk]
             t0 = time.time()
             batch_vecs = self._embed_batch(batch_texts)
             latency_ms = (time.time() - t0) * 1000.0
             self.metrics["batch_latencies_ms"].append(latency_ms)
 
             # Salva no cache e no resultado
-            for idx, vec, text in zip(batch_indices, batch_vecs, batch_texts):
-                k = self._key_for(text)
-                # Salva no cache em formato JSON-serializável (lista)
-                arr = np.asarray(vec, dtype=np.float32)
-                self.cache.put(k, arr.tolist())
-                results[idx] = arr if self.backend == "onnx" else arr.tolist()
+            for (idx, _, k), vec in zip(chunk, batch_vecs):
+                if self.backend == "onnx":
+                    # Salva no cache em formato JSON-serializável (lista)
+                    arr = np.asarray(vec, dtype=np.float32)
+                    self.cache.put(k, arr.tolist())
+                    results[idx] = arr
+                    # Repetições recebem cópias independentes do mesmo vetor
+                    for dup_idx in pending[k][1:]:
+                        results[dup_idx] = arr.copy()
+                else:
+                    # Hashing já devolve listas float32: o cache guarda a lista do lote
+                    # e cada posição recebe a sua cópia (nunca o objeto do cache)
+                    self.cache.put(k, vec)
+                    for dup_idx in pending[k]:
+                        results[dup_idx] = list(vec)
 
         # Por segurança, substitui qualquer None por vetor zero (não deve ocorrer)
         if self.backend == "onnx":
@@ -261,6 +329,10 @@ class EmbeddingsService:
             zero = [0.0] * self.cfg.dim
         return [r if r is not None else zero for r in results]
 
+    def close(self) -> None:
+        """Fecha a conexão SQLite do cache em disco (reaberta sob demanda se o serviço for reutilizado)."""
+        self.cache.disk.close()
+
 
 __all__ = [
     "EmbeddingsConfig",
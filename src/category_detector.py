@@ -7,6 +7,7 @@ categories from various data sources using fuzzy matching and machine learning.
 
 import re
 import json
+import functools
 from typing import Dict, List, Tuple, Optional, Any, Set
 from pathlib import Path
 from fuzzywuzzy import fuzz
@@ -17,6 +18,32 @@ import math
 from importlib import import_module
 
 
+# Noise patterns stripped during normalization (compiled once)
+_NOISE_PATTERNS = (
+    re.compile(r'\b(championship|campeonato|mundial|world|series|cup|copa)\b'),
+    re.compile(r'\b(de|da|do|of|the)\b'),
+    re.compile(r'[^\w\s]'),  # Remove punctuation
+    re.compile(r'\s+'),      # Multiple spaces to single space
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(text: str) -> str:
+    """Stateless text normalization shared by all detector instances.
+
+    `detect_category` re-normalizes every known variation on each call, so
+    caching turns that repeated work into a dict lookup.
+    """
+    # Convert to lowercase and remove accents
+    normalized = unidecode(text.lower())
+
+    # Remove common noise words and characters
+    for pattern in _NOISE_PATTERNS:
+        normalized = pattern.sub(' ', normalized)
+
+    return normalized.strip()
+
+
 class CategoryDetector:
     """Intelligent motorsport category detection and classification system."""
     
@@ -374,21 +401,7 @@ class CategoryDetector:
         if not text:
             return ""
         
-        # Convert to lowercase and remove accents
-        normalized = unidecode(text.lower())
-        
-        # Remove common noise words and characters
-        noise_patterns = [
-            r'\b(championship|campeonato|mundial|world|series|cup|copa)\b',
-            r'\b(de|da|do|of|the)\b',
-            r'[^\w\s]',  # Remove punctuation
-            r'\s+',      # Multiple spaces to single space
-        ]
-        
-        for pattern in noise_patterns:
-            normalized = re.sub(pattern, ' ', normalized)
-        
-        return normalized.strip()
+        return _normalize(text)
     
     def detect_category(self, raw_text: str, source: str = "unknown", context: Optional[Dict[str, Any]] = None) -> Tuple[str, float, Dict[str, Any]]:
         """
@@ -935,16 +948,31 @@ class CategoryDetector:
                     batch_vecs = None
 
                 if batch_vecs is not None:
-                    # Similaridade vs referências
-                    for vec, payload in zip(batch_vecs, per_event_payload):
+                    # Similaridade vs referências: uma única multiplicação de matrizes quando
+                    # o serviço oferece cosine_batch; senão, varredura par a par
+                    cosine_batch = getattr(self._embeddings_service, 'cosine_batch', None)
+                    score_rows = None
+                    if callable(cosine_batch):
+                        try:
+                            score_rows = cosine_batch(batch_vecs, self._semantic_ref_vectors)
+                        except Exception:
+                            score_rows = None
+                    for i, (vec, payload) in enumerate(zip(batch_vecs, per_event_payload)):
                         best_cat = 'Unknown'
                         best_score = 0.0
-                        # varre todas referências
-                        for ref_vec, label in zip(self._semantic_ref_vectors, self._semantic_ref_labels):
-                            score = self._cosine_sim(vec, ref_vec)
-                            if score > best_score:
-                                best_score = score
-                                best_cat = self._semantic_label_to_category.get(label, 'Unknown')
+                        if score_rows is not None:
+                            row = score_rows[i]
+                            j = int(row.argmax())
+                            if row[j] > best_score:
+                                best_score = float(row[j])
+                                best_cat = self._semantic_label_to_category.get(self._semantic_ref_labels[j], 'Unknown')
+                        else:
+                            # varre todas referências
+                            for ref_vec, label in zip(self._semantic_ref_vectors, self._semantic_ref_labels):
+                                score = self._cosine_sim(vec, ref_vec)
+                                if score > best_score:
+                                    best_score = score
+                                    best_cat = self._semantic_label_to_category.get(label, 'Unknown')
                         if best_score >= self.ai_category_threshold and best_cat != 'Unknown':
                             if self.logger:
                                 try:
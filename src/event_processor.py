@@ -185,8 +185,10 @@ class EventProcessor:
                 backend=str(emb.get('backend', 'hashing')),
                 dim=int(emb.get('dim', 256)),
                 lru_capacity=int(emb.get('lru_capacity', 10000)),
+                cache_eviction=str(emb.get('cache_eviction', 'lru')),
                 cache_dir=Path(str(cache.get('dir', 'cache/embeddings'))),
                 ttl_days=int(cache.get('ttl_days', 30)),
+                cache_precision=str(cache.get('precision', 'fp32')),
             )
         except Exception:
             # Fallback seguro
@@ -1086,6 +1088,12 @@ class EventProcessor:
     def get_processing_statistics(self) -> Dict[str, Any]:
         """Get detailed processing statistics."""
         return self.processing_stats.copy()
+
+    def cleanup(self) -> None:
+        """Release resources held by the embeddings service (SQLite cache connection)."""
+        if self._embeddings_service is not None:
+            self._embeddings_service.close()
+            self._embeddings_service = None
     
     def __str__(self) -> str:
         """String representation."""
@@ -600,6 +600,8 @@ def validate_ai_config(config: Dict[str, Any]) -> Dict[str, Any]:
         ) from e
     # Parâmetros opcionais
     model_path = onnx.get('model_path')
+    # Prefere a variante INT8 (<modelo>.qdyn.onnx) quando existir
+    quantized = bool(onnx.get('quantized', False))
     intra_threads = onnx.get('intra_op_num_threads')
     inter_threads = onnx.get('inter_op_num_threads')
     try:
@@ -621,6 +623,7 @@ def validate_ai_config(config: Dict[str, Any]) -> Dict[str, Any]:
         'model_path': model_path,
         'intra_op_num_threads': intra_threads,
         'inter_op_num_threads': inter_threads,
+        'quantized': quantized,
     }
 
     # cache
@@ -651,10 +654,19 @@ def validate_ai_config(config: Dict[str, Any]) -> Dict[str, Any]:
             'ai.cache.ttl_days'
         ) from e
 
+    precision = str(cache.get('precision', 'fp32')).strip().lower()
+    if precision not in {'fp32', 'fp16'}:
+        raise ConfigValidationError(
+            f"Valor inválido para ai.cache.precision: {precision!r} (use 'fp32' ou 'fp16')",
+            ErrorCode.CONFIG_VALIDATION_ERROR,
+            'ai.cache.precision'
+        )
+
     merged['cache'] = {
         'enabled': cache_enabled,
         'dir': str(cache_path.absolute()),
         'ttl_days': ttl_days,
+        'precision': precision,
     }
 
     # embeddings (fase 1)
@@ -670,6 +682,9 @@ def validate_ai_config(config: Dict[str, Any]) -> Dict[str, Any]:
         lru_capacity = int(embeddings.get('lru_capacity', 10000))
         if lru_capacity < 1:
             raise ValueError('embeddings.lru_capacity deve ser >= 1')
+        cache_eviction = str(embeddings.get('cache_eviction', 'lru')).strip().lower()
+        if cache_eviction not in {'lru', 'sieve'}:
+            raise ValueError(f"embeddings.cache_eviction inválido: {cache_eviction!r} (use 'lru' ou 'sieve')")
     except (ValueError, TypeError) as e:
         raise ConfigValidationError(
             f"Valor inválido em ai.embeddings: {e}",
@@ -681,6 +696,7 @@ def validate_ai_config(config: Dict[str, Any]) -> Dict[str, Any]:
         'backend': backend,
         'dim': dim,
         'lru_capacity': lru_capacity,
+        'cache_eviction': cache_eviction,
     }
 
     return merged
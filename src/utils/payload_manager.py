@@ -6,6 +6,7 @@ arquivos de payload gerados durante a execução do sistema.
 """
 import json
 import gzip
+import os
 import shutil
 from pathlib import Path
 from typing import Optional, Dict, Any, Union, List, Tuple
@@ -131,17 +132,20 @@ class PayloadManager:
         cutoff_time = now - timedelta(days=max_age_days)
         
         try:
-            # Lista todos os arquivos no diretório da fonte
+            # Lista todos os arquivos no diretório da fonte; os.scandir traz o tipo
+            # da entrada junto da listagem, evitando um stat extra por arquivo
             files = []
-            for f in source_dir.iterdir():
-                if f.is_file():
-                    mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                    files.append((f, mtime))
+            with os.scandir(source_dir) as it:
+                for entry in it:
+                    if entry.is_file():
+                        mtime = datetime.fromtimestamp(entry.stat().st_mtime)
+                        files.append((Path(entry.path), mtime))
             
             # Ordena por data de modificação (mais antigos primeiro)
             files.sort(key=lambda x: x[1])
             
             # Remove por limite de idade
+            remaining_files = []  # Apenas arquivos que ainda existem
             for filepath, mtime in files:
                 if mtime < cutoff_time:
                     try:
@@ -152,6 +156,7 @@ class PayloadManager:
                                 f"Removido payload antigo: {filepath} "
                                 f"(Última modificação: {mtime})"
                             )
+                        continue
                     except Exception as e:
                         errors += 1
                         if self.logger:
@@ -159,9 +164,9 @@ class PayloadManager:
                                 f"[{ErrorCode.LOG_RETENTION_CLEANUP_FAILED}] "
                                 f"Falha ao remover arquivo antigo {filepath}: {e}"
                             )
+                remaining_files.append(filepath)
             
             # Remove por limite de quantidade (mantém apenas os N mais recentes)
-            remaining_files = [f for f, _ in files if f.exists()]  # Apenas arquivos que ainda existem
             if len(remaining_files) > max_files:
                 # Pega os arquivos mais antigos para remoção
                 for filepath in remaining_files[:-(max_files)]:
@@ -27,6 +27,40 @@ if SRC.exists() and src_str not in sys.path:
     sys.path.insert(0, src_str)
 
 
+# Marcador aplicado por diretório de primeiro nível sob `tests/`
+_TESTS_PARTS = Path(__file__).resolve().parent.parts
+_DIR_MARKER = {
+    "integration": pytest.mark.integration,
+    "property": pytest.mark.property,
+    "regression": pytest.mark.regression,
+}
+_E2E_PREFIX = "test_phase2_e2e_"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Aplica os marcadores da suíte pelo diretório do arquivo.
+
+    - `tests/integration/test_phase2_e2e_*.py`: recebem `e2e` (rodam em job
+      próprio, fora do job de integração);
+    - demais arquivos em `tests/integration/`, `tests/property/` e
+      `tests/regression/`: recebem o marcador homônimo.
+
+    A decisão usa `item.path.parts` (um lookup por item), sem converter o
+    caminho para string.
+    """
+    depth = len(_TESTS_PARTS)
+    for item in items:
+        parts = item.path.parts
+        if len(parts) <= depth + 1 or parts[:depth] != _TESTS_PARTS:
+            continue
+        marker = _DIR_MARKER.get(parts[depth])
+        if marker is None:
+            continue
+        if parts[depth] == "integration" and item.path.name.startswith(_E2E_PREFIX):
+            marker = pytest.mark.e2e
+        item.add_marker(marker)
+
+
 @pytest.fixture(autouse=True, scope="session")
 def _tz_america_sao_paulo():
     """Define TZ padrão para America/Sao_Paulo para garantir determinismo nos testes.
@@ -199,7 +233,13 @@ def freeze_datetime(monkeypatch):
 
         fixed_dt = dt or _dt(2000, 1, 1, 0, 0, 0)
 
-        class _FrozenDateTime(_dt):
+        class _FrozenMeta(type):
+            # `isinstance(x, datetime)` no módulo patchado continua aceitando
+            # datetimes reais (criados fora do patch)
+            def __instancecheck__(cls, obj):
+                return isinstance(obj, _dt)
+
+        class _FrozenDateTime(_dt, metaclass=_FrozenMeta):
             @classmethod
             def now(cls, tz=None):
                 d = fixed_dt
@@ -1,3 +1,4 @@
+import functools
 import pathlib
 from datetime import datetime as dt
 from typing import Optional
@@ -12,6 +13,7 @@ pytestmark = [pytest.mark.integration]
 FIXTURES_DIR = pathlib.Path(__file__).parents[1] / "fixtures" / "html" / "tomada_tempo"
 
 
+@functools.lru_cache(maxsize=None)
 def _read_fixture(name: str) -> str:
     return (FIXTURES_DIR / name).read_text(encoding="utf-8")
 
@@ -75,7 +77,9 @@ def test_entities_normalization(monkeypatch):
         assert isinstance(e.get("streaming_links"), list)
 
 
-def test_duplicates_deduplication(monkeypatch):
+def test_duplicates_deduplication(monkeypatch, freeze_datetime):
+    # "Hoje" fixo: a validação do pipeline descarta eventos a mais de 1 ano de now()
+    freeze_datetime(dt=dt(2025, 8, 1, 12, 0, 0))
     programming_html = _read_fixture("programming_duplicates.html")
     src = TomadaTempoSource()
 
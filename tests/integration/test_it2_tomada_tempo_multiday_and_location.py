@@ -1,3 +1,4 @@
+import functools
 import pathlib
 from datetime import datetime as dt
 from typing import Optional
@@ -11,6 +12,7 @@ pytestmark = [pytest.mark.integration]
 FIXTURES_DIR = pathlib.Path(__file__).parents[1] / "fixtures" / "html" / "tomada_tempo"
 
 
+@functools.lru_cache(maxsize=None)
 def _read_fixture(name: str) -> str:
     return (FIXTURES_DIR / name).read_text(encoding="utf-8")
 
@@ -5,24 +5,27 @@ from src.category_detector import CategoryDetector
 pytestmark = pytest.mark.integration
 
 
-def test_category_exact_match_formula1():
-    det = CategoryDetector()
-    cat, score, meta = det.detect_category("Formula 1")
-    assert cat == "F1"
-    assert score >= 0.99
-    assert meta.get("category_type") == "cars"
-
-
-def test_category_exact_match_endurance_pt():
-    det = CategoryDetector()
-    cat, score, _ = det.detect_category("Campeonato Mundial de Endurance")
-    # Variação mapeada para WEC
-    assert cat == "WEC"
-    assert score >= 0.9
-
-
-def test_category_unknown_low_confidence():
-    det = CategoryDetector()
-    cat, score, _ = det.detect_category("Beach Volleyball Finals 2025")
-    # Não garante Unknown, mas a confiança deve ser inferior ao threshold padrão (0.7)
-    assert score < det.confidence_threshold
+@pytest.fixture(scope="module")
+def detector():
+    return CategoryDetector()
+
+
+@pytest.mark.parametrize(
+    "query,expected_cat,min_score,cat_type",
+    [
+        ("Formula 1", "F1", 0.99, "cars"),
+        # Variação mapeada para WEC
+        ("Campeonato Mundial de Endurance", "WEC", 0.9, None),
+        # Não garante Unknown, mas a confiança deve ser inferior ao threshold padrão (0.7)
+        ("Beach Volleyball Finals 2025", None, None, None),
+    ],
+)
+def test_category(detector, query, expected_cat, min_score, cat_type):
+    cat, score, meta = detector.detect_category(query)
+    if expected_cat is None:
+        assert score < detector.confidence_threshold
+        return
+    assert cat == expected_cat
+    assert score >= min_score
+    if cat_type is not None:
+        assert meta.get("category_type") == cat_type
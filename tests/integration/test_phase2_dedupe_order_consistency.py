@@ -68,11 +68,10 @@ def test_phase2_dedupe_order_consistency(freeze_datetime):
     # 4) Timezone — garantir que todos os DTSTART possuem tz-aware
     cal = Calendar.from_ical(Path(ics_path).read_bytes())
     dtstarts = []
-    for comp in cal.walk():
-        if comp.name == "VEVENT":
-            dt = comp.get("dtstart").dt
-            assert hasattr(dt, "tzinfo") and dt.tzinfo is not None, "DTSTART deve ser timezone-aware"
-            dtstarts.append(dt)
+    for comp in cal.walk("VEVENT"):
+        dt = comp.get("dtstart").dt
+        assert hasattr(dt, "tzinfo") and dt.tzinfo is not None, "DTSTART deve ser timezone-aware"
+        dtstarts.append(dt)
 
     # 5) Ordenação — esperado crescente por horário (ordenção determinística habilitada)
     assert dtstarts == sorted(dtstarts)
@@ -7,6 +7,7 @@ Marcadores: integration
 import json
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 
 import pytest
 
@@ -18,15 +19,21 @@ from icalendar import Calendar
 pytestmark = pytest.mark.integration
 
 
-@pytest.fixture()
-def base_event() -> dict:
-    """Carrega um evento base do cenário simples e garante datetime com timezone."""
+@pytest.fixture(scope="module")
+def _base_event_data() -> MappingProxyType:
+    """Evento base do cenário simples, lido e convertido uma vez por módulo (somente leitura)."""
     fixture_path = Path(__file__).parents[1] / "fixtures" / "integration" / "scenario_basic.json"
-    data = json.loads(fixture_path.read_text(encoding="utf-8"))
+    data = json.loads(fixture_path.read_bytes())
     event = data["events"][0]
     if isinstance(event.get("datetime"), str):
         event["datetime"] = datetime.fromisoformat(event["datetime"])  # preserva offset
-    return event
+    return MappingProxyType(event)
+
+
+@pytest.fixture()
+def base_event(_base_event_data: MappingProxyType) -> dict:
+    """Cópia rasa do evento base: cada teste pode alterá-la sem afetar os demais."""
+    return dict(_base_event_data)
 
 
 def test_edges_streaming_sorted_and_limited_with_alarms(tmp_path: Path, base_event: dict):
@@ -38,11 +38,11 @@ def test_phase2_overnight_integration(tmp_path: Path, overnight_event: dict):
 
     # Parse ICS and assert fields
     cal = Calendar.from_ical(Path(output_path).read_bytes())
-    vevents = [c for c in cal.walk() if c.name == "VEVENT"]
+    vevents = cal.walk("VEVENT")
     assert len(vevents) == 1
 
     ve = vevents[0]
-    uid = str(ve.get("uid")) if ve.get("uid") is not None else ""
+    uid = str(ve.get("uid") or "")
     assert uid.strip() != ""
 
     summary = str(ve.get("summary"))
@@ -10,7 +10,14 @@ from sources.tomada_tempo import TomadaTempoSource
 
 pytestmark = pytest.mark.integration
 
-def test_parse_text_content_basic_line_extracts_event_fields():
+
+@pytest.fixture(scope="module")
+def src():
+    # _parse_text_content não guarda estado entre chamadas: uma instância basta
+    return TomadaTempoSource()
+
+
+def test_parse_text_content_basic_line_extracts_event_fields(src):
     # HTML simples contendo linha textual com palavras-chave de motorsport
     html = """
     <html><body>
@@ -19,7 +26,6 @@ def test_parse_text_content_basic_line_extracts_event_fields():
     </body></html>
     """
 
-    src = TomadaTempoSource()
     target_date = datetime(2025, 10, 20)
 
     events = src._parse_text_content(html, target_date)
@@ -35,7 +41,7 @@ def test_parse_text_content_basic_line_extracts_event_fields():
     assert evt.get("location")
 
 
-def test_parse_text_content_uses_programming_context_when_date_missing():
+def test_parse_text_content_uses_programming_context_when_date_missing(src):
     # Linha sem data explícita, deve associar à data do contexto de programação
     html = """
     <html><body>
@@ -43,7 +49,6 @@ def test_parse_text_content_uses_programming_context_when_date_missing():
     </body></html>
     """
 
-    src = TomadaTempoSource()
     target_date = datetime(2025, 10, 20)
     programming_context = {
         "weekend_dates": [datetime(2025, 10, 20)]
@@ -10,21 +10,24 @@ from tests.utils.ical_snapshots import compare_or_write_snapshot
 
 pytestmark = pytest.mark.integration
 
-@pytest.fixture()
+def _parse_dt(value):
+    # fromisoformat keeps the offset; non-string values pass through untouched
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+@pytest.fixture(scope="module")
 def tz_events() -> list[dict]:
     fixture_path = Path(__file__).parents[1] / "fixtures" / "integration" / "scenario_timezones.json"
     data = json.loads(fixture_path.read_text(encoding="utf-8"))
-    events = data["events"]
+    return [{**ev, "datetime": _parse_dt(ev.get("datetime"))} for ev in data["events"]]
 
-    for ev in events:
-        if isinstance(ev.get("datetime"), str):
-            ev["datetime"] = datetime.fromisoformat(ev["datetime"])  # keeps offset
 
-    return events
+@pytest.fixture(scope="module")
+def gen() -> ICalGenerator:
+    return ICalGenerator()
 
 
-def test_phase2_timezones_integration(tmp_path: Path, tz_events: list[dict]):
-    gen = ICalGenerator()
+def test_phase2_timezones_integration(tmp_path: Path, tz_events: list[dict], gen: ICalGenerator):
     gen.output_directory = str(tmp_path)
 
     output_filename = "phase2_timezones.ics"
@@ -39,7 +42,7 @@ def test_phase2_timezones_integration(tmp_path: Path, tz_events: list[dict]):
 
     # Parse ICS and assert fields
     cal = Calendar.from_ical(Path(output_path).read_bytes())
-    vevents = [c for c in cal.walk() if c.name == "VEVENT"]
+    vevents = cal.walk("VEVENT")
     assert len(vevents) == 2
 
     # Build map by SUMMARY to assert per-event expectations
@@ -53,7 +56,8 @@ def test_phase2_timezones_integration(tmp_path: Path, tz_events: list[dict]):
     assert dtend_br - dtstart_br == timedelta(minutes=90)  # practice default
     # When TZID is present in ICS, icalendar may return naive datetime on decoded();
     # assert TZID parameter presence and local time components instead of utcoffset.
-    tzid_br = ve_br.get("dtstart").params.get("TZID") if ve_br.get("dtstart") is not None else None
+    dtstart_prop_br = ve_br.get("dtstart")
+    tzid_br = dtstart_prop_br.params.get("TZID") if dtstart_prop_br is not None else None
     assert tzid_br, "Expected TZID parameter for BR event"
     assert dtstart_br.hour == 8 and dtstart_br.minute == 0
 
@@ -63,13 +67,14 @@ def test_phase2_timezones_integration(tmp_path: Path, tz_events: list[dict]):
     dtend_uk = ve_uk.decoded("dtend")
     assert isinstance(dtstart_uk, datetime) and isinstance(dtend_uk, datetime)
     assert dtend_uk - dtstart_uk == timedelta(minutes=90)  # practice default
-    tzid_uk = ve_uk.get("dtstart").params.get("TZID") if ve_uk.get("dtstart") is not None else None
+    dtstart_prop_uk = ve_uk.get("dtstart")
+    tzid_uk = dtstart_prop_uk.params.get("TZID") if dtstart_prop_uk is not None else None
     # For UTC, ICS may use 'Z' suffix without TZID, so only assert local time components.
     assert dtstart_uk.hour == 13 and dtstart_uk.minute == 0
 
     # Basic presence
     for ve in vevents:
-        uid = str(ve.get("uid")) if ve.get("uid") is not None else ""
+        uid = str(ve.get("uid") or "")
         assert uid.strip() != ""
         summary = str(ve.get("summary"))
         assert "F1" in summary or "Formula 1" in summary
@@ -4,7 +4,7 @@ Objetivo: validar agregação parcial com execução concorrente e tratamento de
 Marcadores: integration
 """
 
-import time
+import threading
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
@@ -18,6 +18,10 @@ pytestmark = pytest.mark.integration
 
 
 class _FakeSourceFastOK(BaseSource):
+    def __init__(self, barrier: threading.Barrier):
+        super().__init__()
+        self._barrier = barrier
+
     def get_display_name(self) -> str:
         return "Fake Fast OK"
 
@@ -25,8 +29,8 @@ class _FakeSourceFastOK(BaseSource):
         return "https://example.com"
 
     def collect_events(self, target_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        # pequeno delay para garantir execução em thread separada sem flake
-        time.sleep(0.05)
+        # ponto de encontro: só avança quando a outra fonte também estiver rodando
+        self._barrier.wait()
         return [{
             "name": "Evento OK Conc",
             "date": datetime(2025, 1, 1)
@@ -34,6 +38,10 @@ class _FakeSourceFastOK(BaseSource):
 
 
 class _FakeSourceError(BaseSource):
+    def __init__(self, barrier: threading.Barrier):
+        super().__init__()
+        self._barrier = barrier
+
     def get_display_name(self) -> str:
         return "Fake Error"
 
@@ -41,15 +49,18 @@ class _FakeSourceError(BaseSource):
         return "https://example.com"
 
     def collect_events(self, target_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        self._barrier.wait()
         raise RuntimeError("simulated failure")
 
 
 def test_data_collector_concurrent_aggregates_and_handles_errors():
     collector = DataCollector(config_manager=None, logger=None, ui_manager=None)
 
-    # Força duas fontes e concorrência > 1
-    ok_source = _FakeSourceFastOK()
-    err_source = _FakeSourceError()
+    # Força duas fontes e concorrência > 1; a barreira prova que ambas
+    # executaram simultaneamente (com execução serial, wait() estouraria o timeout)
+    barrier = threading.Barrier(2, timeout=2)
+    ok_source = _FakeSourceFastOK(barrier)
+    err_source = _FakeSourceError(barrier)
     collector.active_sources = [err_source, ok_source]
     collector.source_priorities = {
         err_source.source_name: 60,
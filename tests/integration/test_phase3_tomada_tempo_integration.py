@@ -1,15 +1,18 @@
 """
 Phase 3 — Iteração 1: Testes de integração determinísticos para TomadaTempoSource
 - Foco: fluxo collect_events -> _collect_from_weekend_programming -> _parse_calendar_page
-- Sem rede: monkeypatch em make_request para retornar HTML de fixtures
+- Sem rede: make_request substituído na instância para retornar HTML de fixtures
 - Casos: estrutura mínima, headers alternativos, horários sem minutos/variações, overnight
 Marcadores: integration
 """
 
+import functools
 from pathlib import Path
 from datetime import datetime as dt
+import types
 from typing import Optional
 from urllib.parse import urljoin
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -19,20 +22,14 @@ from sources.tomada_tempo import TomadaTempoSource
 pytestmark = pytest.mark.integration
 
 FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "html"
+TARGET_FRIDAY = dt(2025, 8, 1, tzinfo=ZoneInfo("America/Sao_Paulo"))
 
 
+@functools.lru_cache(maxsize=None)
 def read_fixture(name: str) -> str:
     return (FIXTURES_DIR / name).read_text(encoding="utf-8")
 
 
-def make_target_friday(date_str: str = "01/08/2025", tz_name: str = "America/Sao_Paulo"):
-    import pytz
-
-    tz = pytz.timezone(tz_name)
-    base = dt.strptime(date_str, "%d/%m/%Y")
-    return tz.localize(base)
-
-
 def build_main_page(link_text: str, href: str) -> str:
     return f"""
     <html>
@@ -43,13 +40,18 @@ def build_main_page(link_text: str, href: str) -> str:
     """
 
 
+# Página principal idêntica em todos os testes: construída uma única vez
+_PROGRAMMING_HREF = "/programacao-01-08-2025"
+_MAIN_HTML = build_main_page("PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025", _PROGRAMMING_HREF)
+
+
 class DummyResponse:
     def __init__(self, text: str, url: str):
         self.text = text
         self.url = url
 
 
-def _patch_make_request(monkeypatch, src: TomadaTempoSource, main_html: str, programming_html: str, programming_href: str):
+def _patch_make_request(src: TomadaTempoSource, main_html: str, programming_html: str, programming_href: str):
     base_url = src.get_base_url()
     programming_url = urljoin(base_url, programming_href)
 
@@ -60,24 +62,20 @@ def _patch_make_request(monkeypatch, src: TomadaTempoSource, main_html: str, pro
             return DummyResponse(programming_html, programming_url)
         return None
 
-    monkeypatch.setattr(TomadaTempoSource, "make_request", stub, raising=True)
+    # Patch apenas na instância (a classe não é alterada): cada teste cria sua
+    # própria fonte, então não há estado compartilhado sob xdist --dist=load
+    src.make_request = types.MethodType(stub, src)
 
 
-def test_integration_weekend_minimal_structure(monkeypatch):
+def test_integration_weekend_minimal_structure():
     # Arrange
     programming_html = read_fixture("tomada_tempo_weekend_minimal.html")
     src = TomadaTempoSource()
 
-    link_text = "PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025"
-    href = "/programacao-01-08-2025"
-    main_html = build_main_page(link_text, href)
-
-    _patch_make_request(monkeypatch, src, main_html, programming_html, href)
-
-    target_date = make_target_friday()
+    _patch_make_request(src, _MAIN_HTML, programming_html, _PROGRAMMING_HREF)
 
     # Act
-    events = src.collect_events(target_date)
+    events = src.collect_events(TARGET_FRIDAY)
 
     # Assert
     assert isinstance(events, list)
@@ -96,21 +94,15 @@ def test_integration_weekend_minimal_structure(monkeypatch):
     assert isinstance(e0.get("streaming_links"), list)
 
 
-def test_integration_weekend_alt_headers_and_dot_time(monkeypatch):
+def test_integration_weekend_alt_headers_and_dot_time():
     # Arrange
     programming_html = read_fixture("tomada_tempo_weekend_alt_header.html")
     src = TomadaTempoSource()
 
-    link_text = "PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025"
-    href = "/programacao-01-08-2025"
-    main_html = build_main_page(link_text, href)
-
-    _patch_make_request(monkeypatch, src, main_html, programming_html, href)
-
-    target_date = make_target_friday()
+    _patch_make_request(src, _MAIN_HTML, programming_html, _PROGRAMMING_HREF)
 
     # Act
-    events = src.collect_events(target_date)
+    events = src.collect_events(TARGET_FRIDAY)
 
     # Assert
     assert len(events) == 3
@@ -120,21 +112,15 @@ def test_integration_weekend_alt_headers_and_dot_time(monkeypatch):
         assert e.get("time") is not None
 
 
-def test_integration_weekend_no_minutes_and_variants(monkeypatch):
+def test_integration_weekend_no_minutes_and_variants():
     # Arrange
     programming_html = read_fixture("tomada_tempo_weekend_no_minutes.html")
     src = TomadaTempoSource()
 
-    link_text = "PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025"
-    href = "/programacao-01-08-2025"
-    main_html = build_main_page(link_text, href)
-
-    _patch_make_request(monkeypatch, src, main_html, programming_html, href)
-
-    target_date = make_target_friday()
+    _patch_make_request(src, _MAIN_HTML, programming_html, _PROGRAMMING_HREF)
 
     # Act
-    events = src.collect_events(target_date)
+    events = src.collect_events(TARGET_FRIDAY)
 
     # Assert
     assert len(events) >= 4  # parser pode filtrar entradas incompletas
@@ -144,21 +130,15 @@ def test_integration_weekend_no_minutes_and_variants(monkeypatch):
     assert dates.issubset({"2025-08-02", "2025-08-03", "2025-08-01"})
 
 
-def test_integration_weekend_overnight_cross_midnight(monkeypatch):
+def test_integration_weekend_overnight_cross_midnight():
     # Arrange
     programming_html = read_fixture("tomada_tempo_weekend_overnight.html")
     src = TomadaTempoSource()
 
-    link_text = "PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025"
-    href = "/programacao-01-08-2025"
-    main_html = build_main_page(link_text, href)
-
-    _patch_make_request(monkeypatch, src, main_html, programming_html, href)
-
-    target_date = make_target_friday()
+    _patch_make_request(src, _MAIN_HTML, programming_html, _PROGRAMMING_HREF)
 
     # Act
-    events = src.collect_events(target_date)
+    events = src.collect_events(TARGET_FRIDAY)
 
     # Assert: domingo contém eventos após meia-noite
     sunday = [e for e in events if e.get("date") == "2025-08-03"]
@@ -1,7 +1,10 @@
+import functools
 import pathlib
 from datetime import datetime as dt
+import types
 from typing import Optional
 from urllib.parse import urljoin
+from zoneinfo import ZoneInfo
 
 import pytest
 from sources.tomada_tempo import TomadaTempoSource
@@ -9,18 +12,16 @@ from sources.tomada_tempo import TomadaTempoSource
 pytestmark = [pytest.mark.integration]
 
 FIXTURES_DIR = pathlib.Path(__file__).parents[1] / "fixtures" / "html" / "tomada_tempo"
+_TZ = ZoneInfo("America/Sao_Paulo")
 
 
-def _read_fixture(name: str):
+@functools.lru_cache(maxsize=None)
+def _read_fixture(name: str) -> str:
     return (FIXTURES_DIR / name).read_text(encoding="utf-8")
 
 
-def _make_target_friday(date_str: str = "01/08/2025", tz_name: str = "America/Sao_Paulo"):
-    import pytz
-
-    tz = pytz.timezone(tz_name)
-    base = dt.strptime(date_str, "%d/%m/%Y")
-    return tz.localize(base)
+def _make_target_friday(date_str: str = "01/08/2025"):
+    return dt.strptime(date_str, "%d/%m/%Y").replace(tzinfo=_TZ)
 
 
 def _build_main_page(link_text: str, href: str) -> str:
@@ -33,13 +34,18 @@ def _build_main_page(link_text: str, href: str) -> str:
     """
 
 
+# Página principal idêntica em todos os testes: construída uma única vez
+_PROGRAMMING_HREF = "/programacao-01-08-2025"
+_MAIN_HTML = _build_main_page("PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025", _PROGRAMMING_HREF)
+
+
 class _DummyResponse:
     def __init__(self, text: str, url: str):
         self.text = text
         self.url = url
 
 
-def _patch_make_request(monkeypatch, src: TomadaTempoSource, main_html: str, programming_html: str, programming_href: str):
+def _patch_make_request(src: TomadaTempoSource, main_html: str, programming_html: str, programming_href: str):
     base_url = src.get_base_url()
     programming_url = urljoin(base_url, programming_href)
 
@@ -50,19 +56,17 @@ def _patch_make_request(monkeypatch, src: TomadaTempoSource, main_html: str, pro
             return _DummyResponse(programming_html, programming_url)
         return None
 
-    monkeypatch.setattr(TomadaTempoSource, "make_request", stub, raising=True)
+    # Patch apenas na instância (a classe não é alterada): cada caso cria sua
+    # própria fonte, então não há estado compartilhado sob xdist --dist=load
+    src.make_request = types.MethodType(stub, src)
 
 
-def test_tomada_tempo_happy_path(monkeypatch):
+def test_tomada_tempo_happy_path():
     # Arrange
     programming_html = _read_fixture("programming_happy.html")
     src = TomadaTempoSource()
 
-    link_text = "PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025"
-    href = "/programacao-01-08-2025"
-    main_html = _build_main_page(link_text, href)
-
-    _patch_make_request(monkeypatch, src, main_html, programming_html, href)
+    _patch_make_request(src, _MAIN_HTML, programming_html, _PROGRAMMING_HREF)
 
     target_date = _make_target_friday()
 
@@ -77,16 +81,12 @@ def test_tomada_tempo_happy_path(monkeypatch):
         assert isinstance(e.get("streaming_links"), list)
 
 
-def test_tomada_tempo_missing_fields(monkeypatch):
+def test_tomada_tempo_missing_fields():
     # Arrange
     programming_html = _read_fixture("programming_missing_fields.html")
     src = TomadaTempoSource()
 
-    link_text = "PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025"
-    href = "/programacao-01-08-2025"
-    main_html = _build_main_page(link_text, href)
-
-    _patch_make_request(monkeypatch, src, main_html, programming_html, href)
+    _patch_make_request(src, _MAIN_HTML, programming_html, _PROGRAMMING_HREF)
 
     target_date = _make_target_friday()
 
@@ -105,16 +105,12 @@ def test_tomada_tempo_missing_fields(monkeypatch):
     assert any(e for e in events if e.get("location") in (None, ""))
 
 
-def test_tomada_tempo_malformed_html(monkeypatch):
+def test_tomada_tempo_malformed_html():
     # Arrange
     programming_html = _read_fixture("programming_malformed.html")
     src = TomadaTempoSource()
 
-    link_text = "PROGRAMAÇÃO DA TV E INTERNET — 01/08/2025"
-    href = "/programacao-01-08-2025"
-    main_html = _build_main_page(link_text, href)
-
-    _patch_make_request(monkeypatch, src, main_html, programming_html, href)
+    _patch_make_request(src, _MAIN_HTML, programming_html, _PROGRAMMING_HREF)
 
     target_date = _make_target_friday()
 
@@ -1,5 +1,13 @@
+from datetime import datetime
+from typing import Any, List, Optional
+
+import pytest
 from hypothesis import settings, HealthCheck
 
+from sources.base_source import BaseSource
+from src.event_processor import EventProcessor
+from src.ical_generator import ICalGenerator
+
 # Perfil dedicado para property-based tests deste diretório
 settings.register_profile(
     "property",
@@ -13,3 +21,68 @@ settings.register_profile(
     max_examples=30,
 )
 settings.load_profile("property")
+
+
+class DummySource(BaseSource):
+    def get_display_name(self) -> str:
+        return "Dummy"
+
+    def get_base_url(self) -> str:
+        return "http://example.com"
+
+    def collect_events(self, target_date: Optional[datetime] = None):  # pragma: no cover - not used here
+        return []
+
+
+class CapturingCalendar:
+    def __init__(self):
+        self.components: List[Any] = []
+
+    def add_component(self, component):
+        self.components.append(component)
+
+    @property
+    def events_uids(self) -> List[str]:
+        # icalendar.Event exposes get('uid') as vText/vCal types; str() is fine.
+        # Converted only when asserted, not on every add.
+        return [str(uid) for uid in (c.get("uid") for c in self.components) if uid is not None]
+
+    # generate_calendar() writes the calendar to file, so provide a minimal API
+    def to_ical(self):
+        return b"BEGIN:VCALENDAR\nEND:VCALENDAR\n"
+
+
+class StubICalGenerator(ICalGenerator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_calendar = None
+
+    def _create_calendar(self):
+        cal = CapturingCalendar()
+        self._last_calendar = cal
+        return cal
+
+    def _archive_old_ical_files(self):
+        # Avoid touching filesystem history during tests
+        return None
+
+
+# Instâncias compartilhadas pelo módulo: construídas uma vez, e não a cada
+# exemplo gerado pelo Hypothesis dentro do corpo do teste.
+
+@pytest.fixture(scope="module")
+def dummy_source() -> DummySource:
+    return DummySource(config_manager=None, logger=None, ui_manager=None)
+
+
+@pytest.fixture(scope="module")
+def event_processor() -> EventProcessor:
+    return EventProcessor(config_manager=None, logger=None, ui_manager=None)
+
+
+@pytest.fixture(scope="module")
+def stub_ical_generator(tmp_path_factory) -> StubICalGenerator:
+    gen = StubICalGenerator(config_manager=None, logger=None, ui_manager=None)
+    gen.output_directory = str(tmp_path_factory.mktemp("ical"))
+    gen.enforce_sort = True
+    return gen
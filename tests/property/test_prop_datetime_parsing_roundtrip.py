@@ -1,49 +1,43 @@
-from datetime import datetime
-from typing import Optional
-
 import pytest
-import pytz
 from hypothesis import given, strategies as st
 
-from sources.base_source import BaseSource
-from src.event_processor import EventProcessor
-
 
-class DummySource(BaseSource):
-    def get_display_name(self) -> str:
-        return "Dummy"
+# parse_date_time/_compute_datetime recebem o nome do fuso (string)
+tz_name = "America/Sao_Paulo"
 
-    def get_base_url(self) -> str:
-        return "http://example.com"
+_FMT = {
+    "br-slash": "{d:02d}/{m:02d}/{y:04d}",
+    "iso": "{y:04d}-{m:02d}-{d:02d}",
+    "br-dash": "{d:02d}-{m:02d}-{y:04d}",
+}
 
-    def collect_events(self, target_date: Optional[datetime] = None):  # pragma: no cover - not used here
-        return []
 
+def _mk_date_str(y: int, m: int, d: int, fmt: str) -> str:
+    return _FMT[fmt].format(d=d, m=m, y=y)
 
-tz_name = "America/Sao_Paulo"
 
-def _mk_date_str(y: int, m: int, d: int, fmt: str) -> str:
-    if fmt == "br-slash":
-        return f"{d:02d}/{m:02d}/{y:04d}"
-    elif fmt == "iso":
-        return f"{y:04d}-{m:02d}-{d:02d}"
-    else:
-        return f"{d:02d}-{m:02d}-{y:04d}"
+# Estratégias construídas uma vez no import do módulo
+_YEAR = st.integers(min_value=2022, max_value=2026)
+_MONTH = st.integers(min_value=1, max_value=12)
+_DAY = st.integers(min_value=1, max_value=28)  # mantém simples para evitar datas inválidas
+_HOUR = st.integers(min_value=0, max_value=23)
+_MIN = st.integers(min_value=0, max_value=59)
+_FMT_STRAT = st.sampled_from(tuple(_FMT))
 
 
 @pytest.mark.property
 @given(
-    year=st.integers(min_value=2022, max_value=2026),
-    month=st.integers(min_value=1, max_value=12),
-    day=st.integers(min_value=1, max_value=28),  # mantém simples para evitar datas inválidas
-    hour=st.integers(min_value=0, max_value=23),
-    minute=st.integers(min_value=0, max_value=59),
+    year=_YEAR,
+    month=_MONTH,
+    day=_DAY,
+    hour=_HOUR,
+    minute=_MIN,
     include_time=st.booleans(),
-    fmt=st.sampled_from(["br-slash", "iso", "br-dash"]),
+    fmt=_FMT_STRAT,
 )
-def test_parse_datetime_roundtrip(year, month, day, hour, minute, include_time, fmt):
-    src = DummySource(config_manager=None, logger=None, ui_manager=None)
-    ep = EventProcessor(config_manager=None, logger=None, ui_manager=None)
+def test_parse_datetime_roundtrip(year, month, day, hour, minute, include_time, fmt, dummy_source, event_processor):
+    src = dummy_source
+    ep = event_processor
 
     date_str = _mk_date_str(year, month, day, fmt)
     time_str = f"{hour:02d}:{minute:02d}" if include_time else ""
@@ -17,134 +17,92 @@ from sources.tomada_tempo import TomadaTempoSource
 from src.config_manager import ConfigManager
 from src.logger import Logger
 from bs4 import BeautifulSoup
+import pytest
 
-def test_date_extraction():
+# Casos parametrizados: cada entrada vira um teste (seleção individual e distribuição via xdist)
+_DATE_CASES = [
+    ("SÁBADO – 02/08/2025", "02/08/2025"),
+    ("DOMINGO – 03/08/2025", "03/08/2025"),
+    ("sexta – 01/08/2025", "01/08/2025"),
+    ("02/08/2025", "02/08/2025"),
+    ("sábado 02/08/2025", "02/08/2025"),
+]
+
+_TIME_CASES = [
+    ("14:30", "14:30"),
+    ("14h30", "14:30"),
+    ("14h 30", "14:30"),
+    ("às 14h30", "14:30"),
+    ("às 14:30", "14:30"),
+    ("14 horas", "14:00"),
+    ("14 horas e 30", "14:30"),
+    ("16:30 – NASCAR CUP", "16:30"),
+    ("19:00 – FÓRMULA 1", "19:00"),
+]
+
+# Mock programming context
+_PROGRAMMING_CONTEXT = {
+    'start_date': '01/08/2025',
+    'end_date': '03/08/2025',
+    'weekend_dates': ['01/08/2025', '02/08/2025', '03/08/2025'],
+    'programming_title': 'PROGRAMAÇÃO DO FINAL DE SEMANA'
+}
+
+_CONTEXT_CASES = [
+    pytest.param('F1 - FÓRMULA 1', True, id='F1 event without explicit date'),
+    pytest.param('16:30 – NASCAR CUP', True, id='NASCAR event with time but no date'),
+    pytest.param('MotoGP - Grande Prêmio', True, id='MotoGP event without explicit date'),
+    pytest.param('Random text without motorsport content', False, id='Non-motorsport content'),
+]
+
+
+@pytest.fixture(scope="module")
+def source():
+    return TomadaTempoSource()
+
+
+@pytest.mark.parametrize("text,expected", _DATE_CASES)
+def test_date_extraction(source, text, expected):
     """Test enhanced date extraction with weekday patterns."""
-    print("🧪 Testing enhanced date extraction...")
-    
-    source = TomadaTempoSource()
-    
-    test_cases = [
-        ("SÁBADO – 02/08/2025", "02/08/2025"),
-        ("DOMINGO – 03/08/2025", "03/08/2025"),
-        ("sexta – 01/08/2025", "01/08/2025"),
-        ("02/08/2025", "02/08/2025"),
-        ("sábado 02/08/2025", "02/08/2025"),
-    ]
-    
-    for text, expected in test_cases:
-        result = source._extract_date(text)
-        status = "✅" if result == expected else "❌"
-        print(f"  {status} '{text}' -> '{result}' (expected: '{expected}')")
+    assert source._extract_date(text) == expected
 
-def test_time_extraction():
+
+@pytest.mark.parametrize("text,expected", _TIME_CASES)
+def test_time_extraction(source, text, expected):
     """Test improved time format support."""
-    print("\n🧪 Testing improved time extraction...")
-    
-    source = TomadaTempoSource()
-    
-    test_cases = [
-        ("14:30", "14:30"),
-        ("14h30", "14:30"),
-        ("14h 30", "14:30"),
-        ("às 14h30", "14:30"),
-        ("às 14:30", "14:30"),
-        ("14 horas", "14:00"),
-        ("14 horas e 30", "14:30"),
-        ("16:30 – NASCAR CUP", "16:30"),
-        ("19:00 – FÓRMULA 1", "19:00"),
-    ]
-    
-    for text, expected in test_cases:
-        result = source._extract_time(text)
-        status = "✅" if result == expected else "❌"
-        print(f"  {status} '{text}' -> '{result}' (expected: '{expected}')")
+    assert source._extract_time(text) == expected
+
+# Mock HTML with programming title
+_PROGRAMMING_HTML = """
+<html>
+    <head>
+        <title>PROGRAMAÇÃO DA TV E INTERNET - CORRIDAS TRANSMITIDAS NO FINAL DE SEMANA DE 01 A 03-08-2025</title>
+    </head>
+    <body>
+        <h1>Programação do Final de Semana</h1>
+    </body>
+</html>
+"""
 
-def test_programming_context_extraction():
+
+def test_programming_context_extraction(source):
     """Test programming context extraction from page title."""
-    print("\n🧪 Testing programming context extraction...")
-    
-    source = TomadaTempoSource()
-    
-    # Mock HTML with programming title
-    html_content = """
-    <html>
-        <head>
-            <title>PROGRAMAÇÃO DA TV E INTERNET - CORRIDAS TRANSMITIDAS NO FINAL DE SEMANA DE 01 A 03-08-2025</title>
-        </head>
-        <body>
-            <h1>Programação do Final de Semana</h1>
-        </body>
-    </html>
-    """
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(_PROGRAMMING_HTML, 'html.parser')
     context = source._extract_programming_context(soup)
-    
-    print(f"  📅 Programming title: {context.get('programming_title', 'Not found')}")
-    print(f"  📅 Start date: {context.get('start_date', 'Not found')}")
-    print(f"  📅 End date: {context.get('end_date', 'Not found')}")
-    print(f"  📅 Weekend dates: {context.get('weekend_dates', [])}")
-    
-    # Verify results
-    expected_start = "01/08/2025"
-    expected_end = "03/08/2025"
-    
-    status_start = "✅" if context.get('start_date') == expected_start else "❌"
-    status_end = "✅" if context.get('end_date') == expected_end else "❌"
-    
-    print(f"  {status_start} Start date extraction: {context.get('start_date')} (expected: {expected_start})")
-    print(f"  {status_end} End date extraction: {context.get('end_date')} (expected: {expected_end})")
 
-def test_event_association_to_context():
+    assert context.get('start_date') == "01/08/2025"
+    assert context.get('end_date') == "03/08/2025"
+    assert context.get('weekend_dates') == _PROGRAMMING_CONTEXT['weekend_dates']
+
+@pytest.mark.parametrize("line,should_have_date", _CONTEXT_CASES)
+def test_event_association_to_context(source, line, should_have_date):
     """Test association of events without explicit dates to programming context."""
-    print("\n🧪 Testing event association to programming context...")
-    
-    source = TomadaTempoSource()
-    
-    # Mock programming context
-    programming_context = {
-        'start_date': '01/08/2025',
-        'end_date': '03/08/2025',
-        'weekend_dates': ['01/08/2025', '02/08/2025', '03/08/2025'],
-        'programming_title': 'PROGRAMAÇÃO DO FINAL DE SEMANA'
-    }
-    
-    test_cases = [
-        {
-            'line': 'F1 - FÓRMULA 1',
-            'should_have_date': True,
-            'description': 'F1 event without explicit date'
-        },
-        {
-            'line': '16:30 – NASCAR CUP',
-            'should_have_date': True,
-            'description': 'NASCAR event with time but no date'
-        },
-        {
-            'line': 'MotoGP - Grande Prêmio',
-            'should_have_date': True,
-            'description': 'MotoGP event without explicit date'
-        },
-        {
-            'line': 'Random text without motorsport content',
-            'should_have_date': False,
-            'description': 'Non-motorsport content'
-        }
-    ]
-    
-    for test_case in test_cases:
-        event = source._extract_event_from_text_line(test_case['line'], programming_context)
-        
-        if test_case['should_have_date']:
-            has_date = event is not None and event.get('date') is not None
-            status = "✅" if has_date else "❌"
-            date_info = f"date: {event.get('date') if event else 'None'}" if event else "event: None"
-            print(f"  {status} {test_case['description']}: {date_info}")
-        else:
-            is_none = event is None
-            status = "✅" if is_none else "❌"
-            print(f"  {status} {test_case['description']}: {'correctly filtered out' if is_none else 'incorrectly included'}")
+    event = source._extract_event_from_text_line(line, _PROGRAMMING_CONTEXT)
+
+    if should_have_date:
+        assert event is not None and event.get('date') is not None
+    else:
+        assert event is None
 
 def run_all_tests():
     """Run all test cases for Issue #3 fixes."""
@@ -152,10 +110,14 @@ def run_all_tests():
     print("=" * 80)
     
     try:
-        test_date_extraction()
-        test_time_extraction()
-        test_programming_context_extraction()
-        test_event_association_to_context()
+        source = TomadaTempoSource()
+        for text, expected in _DATE_CASES:
+            test_date_extraction(source, text, expected)
+        for text, expected in _TIME_CASES:
+            test_time_extraction(source, text, expected)
+        test_programming_context_extraction(source)
+        for case in _CONTEXT_CASES:
+            test_event_association_to_context(source, *case.values)
         
         print("\n" + "=" * 80)
         print("✅ All tests completed! Review the results above to verify the fixes.")
@@ -0,0 +1,143 @@
+import sqlite3
+import time
+
+import pytest
+
+from src.ai.cache import DiskCache, LRUCache, SieveCache
+
+
+@pytest.mark.unit
+def test_lru_cache_get_miss_and_hit():
+    cache = LRUCache(capacity=2)
+    assert cache.get("a") is None
+
+    cache.put("a", [1.0])
+    assert cache.get("a") == [1.0]
+
+
+@pytest.mark.unit
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(capacity=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+
+    # Acesso a "a" o torna o mais recente; "b" deve ser removido
+    assert cache.get("a") == [1.0]
+    cache.put("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
+    assert cache.get("c") == [3.0]
+
+
+@pytest.mark.unit
+def test_lru_cache_put_existing_key_updates_value_and_recency():
+    cache = LRUCache(capacity=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    cache.put("a", [9.0])  # atualiza e torna "a" o mais recente
+    cache.put("c", [3.0])
+
+    assert cache.get("a") == [9.0]
+    assert cache.get("b") is None
+    assert len(cache.data) == 2
+
+
+@pytest.mark.unit
+def test_sieve_cache_evicts_first_unvisited_from_oldest():
+    cache = SieveCache(capacity=3)
+    for k in ("a", "b", "c"):
+        cache.put(k, [float(ord(k))])
+
+    # "a" e "c" visitados; o hand parte do mais antigo e despeja "b"
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    cache.put("d", [4.0])
+    assert set(cache.data) == {"a", "c", "d"}
+
+    # O hand continua de onde parou ("c", ainda marcado): limpa a marca e despeja "d"
+    cache.put("e", [5.0])
+    assert set(cache.data) == {"a", "c", "e"}
+
+    # Agora nada está marcado: o hand volta ao mais antigo e despeja "a"
+    cache.put("f", [6.0])
+    assert set(cache.data) == {"c", "e", "f"}
+
+
+@pytest.mark.unit
+def test_sieve_cache_keeps_hot_key_under_scan():
+    cache = SieveCache(capacity=2)
+    cache.put("hot", [1.0])
+    for i in range(10):
+        assert cache.get("hot") == [1.0]
+        cache.put(f"scan{i}", [float(i)])
+        assert len(cache.data) == 2
+
+    assert cache.get("hot") == [1.0]
+
+
+@pytest.mark.unit
+def test_sieve_cache_put_existing_key_updates_value():
+    cache = SieveCache(capacity=1)
+    cache.put("a", [1.0])
+    cache.put("a", [2.0])
+    assert cache.get("a") == [2.0]
+    cache.put("b", [3.0])
+    assert set(cache.data) == {"b"}
+
+
+@pytest.mark.unit
+def test_disk_cache_reuses_connection_and_persists(tmp_path, monkeypatch):
+    db_path = tmp_path / "cache" / "embeddings_cache.sqlite"
+
+    connects = []
+    real_connect = sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        connects.append(args[0])
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", counting_connect)
+
+    disk = DiskCache(db_path=db_path, ttl_days=30)
+    for i in range(5):
+        disk.put(f"k{i}", [float(i)])
+    assert [disk.get(f"k{i}") for i in range(5)] == [[float(i)] for i in range(5)]
+    assert disk.get("ausente") is None
+
+    # Uma única conexão para init + 5 puts + 6 gets
+    assert len(connects) == 1
+
+    # Dados persistem para uma nova instância
+    disk.close()
+    assert DiskCache(db_path=db_path, ttl_days=30).get("k3") == [3.0]
+
+
+@pytest.mark.unit
+def test_disk_cache_expired_entry_is_a_miss(tmp_path, monkeypatch):
+    disk = DiskCache(db_path=tmp_path / "cache.sqlite", ttl_days=1)
+    disk.put("k", [1.0])
+
+    later = time.time() + 2 * 86400
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert disk.get("k") is None
+
+
+@pytest.mark.unit
+def test_disk_cache_fp16_roundtrip_and_reads_json_entries(tmp_path):
+    db_path = tmp_path / "cache.sqlite"
+    value = [0.1234567, -0.5, 0.0, 0.75]
+
+    # Entrada gravada em fp32 (JSON) continua legível com precision=fp16
+    DiskCache(db_path=db_path, ttl_days=30).put("json", value)
+    disk = DiskCache(db_path=db_path, ttl_days=30, precision="fp16")
+    assert disk.get("json") == value
+
+    disk.put("blob", value)
+    got = disk.get("blob")
+    assert isinstance(got, list) and len(got) == len(value)
+    assert max(abs(a - b) for a, b in zip(got, value)) < 1e-3
+
+    with sqlite3.connect(str(db_path)) as conn:
+        (raw,) = conn.execute("SELECT v FROM embeddings WHERE k='blob'").fetchone()
+    assert isinstance(raw, bytes) and len(raw) == 2 * len(value)
@@ -339,3 +339,201 @@ def test_onnx_provider_fallback(tmp_path, caplog):
         # Verifica se o log de aviso foi registrado
         assert any("Falha ao inicializar ONNX Runtime" in record.message 
                   for record in caplog.records)
+
+
+@pytest.mark.unit
+def test_cosine_batch_matches_pairwise_cosine(tmp_path: Path):
+    cfg = EmbeddingsConfig(
+        enabled=True,
+        device="cpu",
+        batch_size=4,
+        backend="hashing",
+        dim=64,
+        lru_capacity=64,
+        cache_dir=tmp_path / "cache",
+        ttl_days=30,
+    )
+    svc = EmbeddingsService(cfg)
+
+    a = svc.embed_texts(["F1 Grand Prix São Paulo", "MotoGP Argentina"])
+    b = svc.embed_texts(["F1 Grand Prix", "Stock Car Brasil Goiânia", "MotoGP Argentina"])
+
+    sims = EmbeddingsService.cosine_batch(a, b)
+    assert sims.shape == (2, 3)
+
+    # Mesmo resultado que o cosseno calculado par a par
+    for i, u in enumerate(a):
+        for j, v in enumerate(b):
+            u_arr, v_arr = np.asarray(u), np.asarray(v)
+            expected = float(u_arr @ v_arr / (np.linalg.norm(u_arr) * np.linalg.norm(v_arr)))
+            assert sims[i, j] == pytest.approx(expected, abs=1e-5)
+
+    # Vetor nulo não gera NaN
+    assert np.all(EmbeddingsService.cosine_batch([[0.0] * cfg.dim], b) == 0.0)
+
+
+@pytest.mark.unit
+def test_duplicate_texts_in_call_are_computed_once(tmp_path: Path):
+    cfg = EmbeddingsConfig(
+        enabled=True,
+        device="cpu",
+        batch_size=2,
+        backend="hashing",
+        dim=64,
+        lru_capacity=64,
+        cache_dir=tmp_path / "cache",
+        ttl_days=30,
+    )
+    svc = EmbeddingsService(cfg)
+
+    seen = []
+    original = svc._embed_batch
+
+    def spy(batch):
+        seen.extend(batch)
+        return original(batch)
+
+    svc._embed_batch = spy
+
+    texts = ["F1 Brasil", "MotoGP Argentina", "F1 Brasil", "F1 Brasil", "MotoGP Argentina"]
+    embs = svc.embed_texts(texts)
+
+    # Apenas os textos únicos vão ao backend (um único lote de 2)
+    assert seen == ["F1 Brasil", "MotoGP Argentina"]
+    assert len(svc.metrics["batch_latencies_ms"]) == 1
+
+    # Ordem preservada e repetições com o mesmo vetor, mas objetos independentes
+    assert len(embs) == len(texts)
+    assert embs[0] == embs[2] == embs[3]
+    assert embs[1] == embs[4]
+    assert embs[0] is not embs[2]
+
+
+@pytest.mark.unit
+def test_onnx_session_shared_between_services(tmp_path):
+    """Serviços com o mesmo modelo/providers reutilizam a mesma InferenceSession."""
+    mock_session = MagicMock()
+    mock_session.run.return_value = [np.random.rand(1, 384).astype(np.float32)]
+
+    model_path = tmp_path / "model.onnx"
+    model_path.touch()
+
+    with patch('onnxruntime.InferenceSession', return_value=mock_session) as mock_onnx:
+        services = [
+            EmbeddingsService(
+                EmbeddingsConfig(
+                    enabled=True,
+                    backend="onnx",
+                    dim=384,
+                    cache_dir=tmp_path / f"onnx_cache_{i}",
+                    onnx_enabled=True,
+                    onnx_model_path=model_path,
+                    onnx_providers=["cpu"],
+                )
+            )
+            for i in range(2)
+        ]
+
+        mock_onnx.assert_called_once()
+        assert services[0].ort_session is services[1].ort_session is mock_session
+        assert all(svc.backend == "onnx" for svc in services)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("intra,inter,expected", [(None, None, (1, 1)), (4, 2, (4, 2))])
+def test_onnx_session_options_defaults_and_overrides(tmp_path, intra, inter, expected):
+    """Sem threads configuradas, a sessão ONNX usa 1 thread sequencial com otimização total."""
+    import onnxruntime as ort
+
+    model_path = tmp_path / "model.onnx"
+    model_path.touch()
+
+    with patch('onnxruntime.InferenceSession', return_value=MagicMock()) as mock_onnx:
+        EmbeddingsService(
+            EmbeddingsConfig(
+                enabled=True,
+                backend="onnx",
+                dim=384,
+                cache_dir=tmp_path / "onnx_cache",
+                onnx_enabled=True,
+                onnx_model_path=model_path,
+                onnx_intra_op_num_threads=intra,
+                onnx_inter_op_num_threads=inter,
+            )
+        )
+
+    sess_opts = mock_onnx.call_args.args[1]
+    assert (sess_opts.intra_op_num_threads, sess_opts.inter_op_num_threads) == expected
+    assert sess_opts.execution_mode == ort.ExecutionMode.ORT_SEQUENTIAL
+    assert sess_opts.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("with_quant_file,expected_name", [(True, "model.qdyn.onnx"), (False, "model.onnx")])
+def test_onnx_quantized_prefers_qdyn_variant(tmp_path, with_quant_file, expected_name):
+    """onnx_quantized carrega <modelo>.qdyn.onnx quando existir; senão usa o modelo original."""
+    model_path = tmp_path / "model.onnx"
+    model_path.touch()
+    if with_quant_file:
+        (tmp_path / "model.qdyn.onnx").touch()
+
+    with patch('onnxruntime.InferenceSession', return_value=MagicMock()) as mock_onnx:
+        svc = EmbeddingsService(
+            EmbeddingsConfig(
+                enabled=True,
+                backend="onnx",
+                dim=384,
+                cache_dir=tmp_path / "onnx_cache",
+                onnx_enabled=True,
+                onnx_model_path=model_path,
+                onnx_quantized=True,
+            )
+        )
+
+    assert svc.backend == "onnx"
+    assert Path(mock_onnx.call_args.args[0]).name == expected_name
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("policy,expected", [("lru", "LRUCache"), ("sieve", "SieveCache"), ("SIEVE", "SieveCache")])
+def test_cache_eviction_policy_selects_memory_cache(tmp_path, policy, expected):
+    cfg = EmbeddingsConfig(enabled=True, dim=32, lru_capacity=2, cache_dir=tmp_path / "cache", cache_eviction=policy)
+    svc = EmbeddingsService(cfg)
+    assert type(svc.cache.memory).__name__ == expected
+
+    embs1 = svc.embed_texts(["F1 Brasil", "MotoGP Argentina", "Stock Car Goiânia"])
+    embs2 = svc.embed_texts(["F1 Brasil", "MotoGP Argentina", "Stock Car Goiânia"])
+    assert embs1 == embs2
+
+
+@pytest.mark.unit
+def test_returned_vectors_do_not_alias_cache_entries(tmp_path: Path):
+    cfg = EmbeddingsConfig(enabled=True, dim=32, cache_dir=tmp_path / "cache")
+    svc = EmbeddingsService(cfg)
+
+    first = svc.embed_texts(["F1 Brasil", "F1 Brasil"])
+    expected = list(first[0])
+
+    # Mutar o retorno (miss e hit) não pode corromper o cache
+    first[0][0] = 123.0
+    first[1][0] = 456.0
+    second = svc.embed_texts(["F1 Brasil"])
+    assert second[0] == expected
+    second[0][0] = 789.0
+    assert svc.embed_texts(["F1 Brasil"])[0] == expected
+
+
+@pytest.mark.unit
+def test_close_releases_disk_connection_and_reopens_on_demand(tmp_path: Path):
+    cfg = EmbeddingsConfig(enabled=True, dim=16, cache_dir=tmp_path / "cache")
+    svc = EmbeddingsService(cfg)
+    expected = svc.embed_texts(["F1 Brasil"])[0]
+    assert svc.cache.disk._conn is not None
+
+    svc.close()
+    assert svc.cache.disk._conn is None
+
+    # Reuso após close: a conexão é reaberta e o disco ainda serve o vetor
+    svc.cache.memory = type(svc.cache.memory)(cfg.lru_capacity)
+    assert svc.embed_texts(["F1 Brasil"])[0] == pytest.approx(expected)
+    svc.close()
@@ -2,6 +2,7 @@ import hashlib
 import math
 import pytest
 
+from src.ai.embeddings_service import EmbeddingsService
 from src.category_detector import CategoryDetector
 
 
@@ -28,10 +29,15 @@ class StubEmbeddingsService:
         return vectors
 
 
-def _patch_embeddings_service(detector: CategoryDetector, monkeypatch, dim: int = 8192):
+class StubEmbeddingsServiceWithCosine(StubEmbeddingsService):
+    """Stub que expõe o cosine_batch real (caminho vetorizado do detector)."""
+    cosine_batch = staticmethod(EmbeddingsService.cosine_batch)
+
+
+def _patch_embeddings_service(detector: CategoryDetector, monkeypatch, dim: int = 8192, stub_cls=StubEmbeddingsService):
     """Monkeypatch para injetar o StubEmbeddingsService no detector."""
     def _fake_ensure():
-        detector._embeddings_service = StubEmbeddingsService(dim=dim, logger=detector.logger, config=detector.config)
+        detector._embeddings_service = stub_cls(dim=dim, logger=detector.logger, config=detector.config)
         return True
 
     monkeypatch.setattr(detector, "_ensure_embeddings_service", _fake_ensure)
@@ -69,6 +75,28 @@ def test_detect_categories_batch_semantic_with_stub(monkeypatch):
     assert r1["confidence"] >= detector.ai_category_threshold
 
 
+@pytest.mark.unit
+def test_detect_categories_batch_cosine_batch_matches_pairwise(monkeypatch):
+    events = [
+        {"raw_category": "F1", "name": "Some Event", "source": "test"},
+        {"name": "Grand Prix", "source": "test"},
+        {"raw_category": "Categoria Inexistente XYZ", "name": "Evento", "source": "test"},
+    ]
+
+    results = []
+    for stub_cls in (StubEmbeddingsService, StubEmbeddingsServiceWithCosine):
+        detector = CategoryDetector(config_manager=None, logger=None)
+        detector.ai_enabled = True
+        _patch_embeddings_service(detector, monkeypatch, stub_cls=stub_cls)
+        results.append(detector.detect_categories_batch(events))
+
+    pairwise, batched = results
+    assert [r["category"] for r in batched] == [r["category"] for r in pairwise]
+    assert [r["source"] for r in batched] == [r["source"] for r in pairwise]
+    for rb, rp in zip(batched, pairwise):
+        assert math.isclose(rb["confidence"], rp["confidence"], abs_tol=1e-5)
+
+
 @pytest.mark.unit
 def test_detect_categories_batch_ai_enabled_but_no_service_fallbacks_to_heuristic():
     detector = CategoryDetector(config_manager=None, logger=None)
@@ -113,8 +113,10 @@ class TestEventProcessorPipeline:
         assert out == []
         assert any('No events to process' in w for w in logger.warnings)
 
-    def test_process_events_pipeline_with_detector_and_silent(self):
+    def test_process_events_pipeline_with_detector_and_silent(self, freeze_datetime):
         _ensure_stubs()
+        # "Hoje" fixo: a validação descarta eventos a mais de 1 ano de now()
+        freeze_datetime(dt=datetime(2025, 8, 8, 12, 0, 0))
         from src.event_processor import EventProcessor
         logger = _LoggerStub()
         cfg = _ConfigStub(tz='UTC')
@@ -77,3 +77,18 @@ class TestEventProcessorStatsRepr:
         r = repr(self.ep)
         assert 'EventProcessor(' in s and 'threshold=' in s
         assert '<EventProcessor(' in r and 'time_tolerance=' in r and r.endswith('min)>')
+
+    def test_cleanup_closes_embeddings_service(self):
+        # Sem serviço inicializado, cleanup é no-op
+        self.ep.cleanup()
+
+        class _SvcStub:
+            closed = False
+            def close(self):
+                self.closed = True
+
+        svc = _SvcStub()
+        self.ep._embeddings_service = svc
+        self.ep.cleanup()
+        assert svc.closed
+        assert self.ep._embeddings_service is None
@@ -5,8 +5,10 @@ Foco: estrutura de programação do fim de semana (h5 + ul/li), cabeçalhos alte
 horários sem minutos/variações, eventos overnight e extração de contexto do título.
 """
 
+import functools
 from pathlib import Path
 from datetime import datetime as dt
+import pytest
 import pytz
 from bs4 import BeautifulSoup
 
@@ -16,6 +18,7 @@ from sources.tomada_tempo import TomadaTempoSource
 FIXTURES_DIR = Path(__file__).resolve().parents[4] / "tests" / "fixtures" / "html"
 
 
+@functools.lru_cache(maxsize=None)
 def read_fixture(name: str) -> str:
     return (FIXTURES_DIR / name).read_text(encoding="utf-8")
 
@@ -162,3 +165,29 @@ def test_extract_programming_context_from_title():
     assert context["start_date"] == "01/08/2025"
     assert context["end_date"] == "03/08/2025"
     assert context["weekend_dates"] == ["01/08/2025", "02/08/2025", "03/08/2025"]
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    [
+        "tomada_tempo_weekend_minimal.html",
+        "tomada_tempo_weekend_alt_header.html",
+        "tomada_tempo_weekend_no_minutes.html",
+        "tomada_tempo_weekend_overnight.html",
+        "tomada_tempo_weekend_edge_cases.html",
+        "tomada_tempo_weekend_malformed.html",
+    ],
+)
+def test_lxml_parser_matches_html_parser(fixture_name):
+    # Paridade: o parser padrão (lxml) extrai os mesmos eventos que o html.parser
+    html = read_fixture(fixture_name)
+    target_date = make_target_friday()
+
+    source = TomadaTempoSource()
+    assert source.BS4_PARSER == "lxml"
+    events_lxml = source._parse_calendar_page(html, target_date)
+
+    source.BS4_PARSER = "html.parser"
+    events_stdlib = source._parse_calendar_page(html, target_date)
+
+    assert events_lxml == events_stdlib
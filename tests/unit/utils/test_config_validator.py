@@ -253,6 +253,7 @@ class TestConfigValidator(unittest.TestCase):
         self.assertTrue(result['onnx']['enabled'])
         self.assertEqual(result['onnx']['provider'], 'cuda')
         self.assertEqual(result['onnx']['opset'], 17)
+        self.assertFalse(result['onnx']['quantized'])
         # Cache
         self.assertFalse(result['cache']['enabled'])
         self.assertEqual(result['cache']['ttl_days'], 7)
@@ -289,6 +290,10 @@ class TestConfigValidator(unittest.TestCase):
             validate_ai_config({'onnx': {'opset': 9}})
         self.assertEqual(cm.exception.error_code, ErrorCode.CONFIG_VALIDATION_ERROR)
 
+    def test_validate_ai_config_onnx_quantized(self):
+        result = validate_ai_config({'onnx': {'enabled': True, 'quantized': True}})
+        self.assertTrue(result['onnx']['quantized'])
+
     @patch('os.access', return_value=False)
     def test_validate_ai_config_cache_permission_error(self, mock_access):
         cache_dir = str(self.test_dir / 'ai_cache_perm')
@@ -301,6 +306,18 @@ class TestConfigValidator(unittest.TestCase):
             validate_ai_config({'cache': {'ttl_days': -1}})
         self.assertEqual(cm.exception.error_code, ErrorCode.CONFIG_VALIDATION_ERROR)
 
+    def test_validate_ai_config_invalid_cache_precision(self):
+        with self.assertRaises(ConfigValidationError) as cm:
+            validate_ai_config({'cache': {'precision': 'fp8'}})
+        self.assertEqual(cm.exception.error_code, ErrorCode.CONFIG_VALIDATION_ERROR)
+        self.assertEqual(cm.exception.field, 'ai.cache.precision')
+
+    def test_validate_ai_config_invalid_cache_eviction(self):
+        with self.assertRaises(ConfigValidationError) as cm:
+            validate_ai_config({'embeddings': {'cache_eviction': 'seive'}})
+        self.assertEqual(cm.exception.error_code, ErrorCode.CONFIG_VALIDATION_ERROR)
+        self.assertIn('cache_eviction', cm.exception.message)
+
     def test_validate_ai_config_non_object(self):
         with self.assertRaises(ConfigValidationError) as cm:
             validate_ai_config(['not', 'a', 'dict'])
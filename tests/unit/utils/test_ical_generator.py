@@ -1,5 +1,6 @@
 import os
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 import pytz
@@ -74,10 +75,9 @@ def test_generate_calendar_writes_file_and_validates(tmp_path):
     assert validation["events_count"] == 1
 
     # Parse ICS and assert vevent fields
-    with open(out_path, "rb") as f:
-        cal = Calendar.from_ical(f.read())
+    cal = Calendar.from_ical(Path(out_path).read_bytes())
 
-    vevents = [c for c in cal.walk() if c.name == "VEVENT"]
+    vevents = cal.walk("VEVENT")
     assert len(vevents) == 1
     ve = vevents[0]
 
@@ -128,10 +128,9 @@ def test_create_ical_event_fields_for_non_race_session(tmp_path):
 
     # End-to-end via ICS for robust assertion of fields
     out_path = gen.generate_calendar([event], output_filename="qual.ics")
-    with open(out_path, "rb") as f:
-        cal = Calendar.from_ical(f.read())
+    cal = Calendar.from_ical(Path(out_path).read_bytes())
 
-    ve = [c for c in cal.walk() if c.name == "VEVENT"][0]
+    ve = cal.walk("VEVENT")[0]
 
     # SUMMARY must append session type when not 'race'
     assert ve.get("summary").to_ical().decode() == "Formula 1 - Monaco GP (Qualifying)"
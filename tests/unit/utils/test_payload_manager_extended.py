@@ -70,6 +70,30 @@ def test_cleanup_old_payloads_by_age(tmp_path: Path):
     assert removed >= 2  # pelo menos os dois antigos
 
 
+def test_cleanup_old_payloads_many_files_keeps_newest(tmp_path: Path):
+    base_dir = tmp_path / "payloads"
+    pm = PayloadManager(base_dir=str(base_dir), logger=LoggerStub())
+
+    # 500 arquivos com mtimes distintos (payload_0 é o mais antigo)
+    src_dir = base_dir / "bulk_src"
+    src_dir.mkdir(parents=True)
+    now = time()
+    for i in range(500):
+        f = src_dir / f"payload_{i}.json"
+        f.write_text("{}")
+        ts = now - (500 - i) * 60
+        os.utime(f, (ts, ts))
+    # Subdiretórios não são considerados payloads
+    (src_dir / "nested").mkdir()
+
+    removed, errors = pm.cleanup_old_payloads("bulk_src", max_files=50, max_age_days=3650)
+    assert (removed, errors) == (450, 0)
+
+    remaining = {e.name for e in os.scandir(src_dir) if e.is_file()}
+    assert remaining == {f"payload_{i}.json" for i in range(450, 500)}
+    assert (src_dir / "nested").is_dir()
+
+
 def test_cleanup_all_old_payloads_limits_per_source(tmp_path: Path):
     base_dir = tmp_path / "payloads"
     pm = PayloadManager(base_dir=str(base_dir), logger=LoggerStub())
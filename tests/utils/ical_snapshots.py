@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from pathlib import Path
 import difflib
+import os
 import re
 from typing import Union
 
@@ -81,7 +82,13 @@ def compare_or_write_snapshot(generated_path: Union[str, Path], snapshot_path: U
 
     If the snapshot does not exist, create it from the normalized generated ICS
     and pass the test. Subsequent runs must match.
+
+    Setting ``SKIP_SNAPSHOT_COMPARE=1`` skips the read/normalize/diff entirely
+    (intended for smoke jobs that only need the functional assertions).
     """
+    if os.environ.get("SKIP_SNAPSHOT_COMPARE") == "1":
+        return
+
     gen_path = Path(generated_path)
     snap_path = Path(snapshot_path)
     snap_path.parent.mkdir(parents=True, exist_ok=True)